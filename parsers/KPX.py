@@ -1,12 +1,14 @@
 import json
 import re
-from datetime import datetime, time, timedelta
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
 from logging import Logger, getLogger
 from zoneinfo import ZoneInfo
 
-import pandas as pd
-from bs4 import BeautifulSoup
+import lxml.html
 from requests import Session
+from requests.adapters import HTTPAdapter, Retry
 
 from electricitymap.contrib.config import ZoneKey
 from electricitymap.contrib.lib.models.event_lists import (
@@ -45,6 +47,90 @@ STORAGE_MAPPING = {"raisingWater": "hydro"}
 # New energy: Hydrogen, Fuel Cell, Coal liquefied or gasified energy, and vacuum residue gasified energy, etc.
 # Renewable: Solar, Wind power, Water power, ocean energy, Geothermal, Bio energy, etc.
 
+# Timestamp shown on the realtime page, e.g. "2023.09.13(수) 17:40 새로고침".
+CONSUMPTION_DATE_RE = re.compile(
+    r"(\d{4})\.(\d{2})\.(\d{2})\([^)]*\)\s*(\d{1,2}):(\d{2})"
+)
+
+# Shared session so TCP/TLS connections to new.kpx.or.kr are reused across
+# fetchers when the caller does not provide its own session. Transient KPX
+# gateway errors are retried with a short backoff.
+SESSION = Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+        ),
+    ),
+)
+
+# Historical chart responses are immutable once the day has passed, so keep
+# the raw response text per day and skip the GET/POST pair on repeated
+# backfill calls. Oldest entries are evicted first.
+_HISTORICAL_CACHE: dict[str, str] = {}
+_HISTORICAL_CACHE_MAX_SIZE = 512
+
+# fetch_consumption and realtime fetch_production read the same page; cache
+# the decoded response briefly so a scheduler cycle that calls both only
+# downloads it once.
+_REALTIME_CACHE: dict[str, tuple[float, str]] = {}
+_REALTIME_CACHE_TTL_SECONDS = 30.0
+
+
+def _fresh_cached_response(url: str) -> str | None:
+    cached = _REALTIME_CACHE.get(url)
+    if (
+        cached is not None
+        and time.monotonic() - cached[0] < _REALTIME_CACHE_TTL_SECONDS
+    ):
+        return cached[1]
+    return None
+
+
+def _cached_get(session: Session, url: str) -> str:
+    raw_data = _fresh_cached_response(url)
+    if raw_data is None:
+        response = session.get(url, verify=False)
+        assert response.status_code == 200
+        raw_data = response.text
+        _REALTIME_CACHE[url] = (time.monotonic(), raw_data)
+    return raw_data
+
+
+def parse_consumption_data(
+    raw_data: str,
+    zone_key: ZoneKey = ZoneKey("KR"),
+    logger: Logger = getLogger(__name__),
+) -> TotalConsumptionList:
+    tree = lxml.html.fromstring(raw_data)
+    consumption_cell = tree.xpath(
+        '//th[contains(normalize-space(.), "현재부하")]/following-sibling::*[1]'
+    )[0]
+    consumption_val = float(consumption_cell.text_content().split()[0].replace(",", ""))
+
+    info_top = tree.xpath(
+        '//p[contains(concat(" ", normalize-space(@class), " "), " info_top ")]'
+    )[0]
+    date_match = CONSUMPTION_DATE_RE.search(info_top.text_content())
+    consumption_date = datetime(
+        *(int(group) for group in date_match.groups()), tzinfo=TIMEZONE
+    )
+
+    consumption_list = TotalConsumptionList(logger)
+    consumption_list.append(
+        zoneKey=zone_key,
+        datetime=consumption_date,
+        source=KR_SOURCE,
+        consumption=consumption_val,
+    )
+
+    return consumption_list
+
 
 def fetch_consumption(
     zone_key: ZoneKey = ZoneKey("KR"),
@@ -60,31 +146,10 @@ def fetch_consumption(
         )
 
     logger.debug(f"Fetching consumption data from {REAL_TIME_URL}")
-    session = session or Session()
-    response = session.get(REAL_TIME_URL, verify=False)
-    assert response.status_code == 200
+    session = session or SESSION
+    raw_data = _cached_get(session, REAL_TIME_URL)
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    consumption_title = soup.find("th", string=re.compile(r"\s*현재부하\s*"))
-    consumption_val = float(
-        consumption_title.find_next_sibling().text.split()[0].replace(",", "")
-    )
-
-    consumption_date_list = soup.find("p", {"class": "info_top"}).text.split(" ")[:2]
-    consumption_date_list[0] = consumption_date_list[0].replace(".", "-").split("(")[0]
-    consumption_date = datetime.strptime(
-        " ".join(consumption_date_list), "%Y-%m-%d %H:%M"
-    ).replace(tzinfo=TIMEZONE)
-
-    consumption_list = TotalConsumptionList(logger)
-    consumption_list.append(
-        zoneKey=zone_key,
-        datetime=consumption_date,
-        source=KR_SOURCE,
-        consumption=consumption_val,
-    )
-
-    return consumption_list.to_list()
+    return parse_consumption_data(raw_data, zone_key, logger).to_list()
 
 
 @refetch_frequency(timedelta(hours=167))
@@ -99,7 +164,7 @@ def fetch_price(
         now if target_datetime is None else target_datetime.astimezone(TIMEZONE)
     )
 
-    today = datetime.combine(now, time(), tzinfo=TIMEZONE)  # truncates to day
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
     first_available_api_date = today - timedelta(days=6) + timedelta(hours=1)
     if target_datetime < first_available_api_date:
         raise ParserException(
@@ -109,39 +174,77 @@ def fetch_price(
         )
 
     logger.debug(f"Fetching price data from {PRICE_URL}")
-    session = session or Session()
+    session = session or SESSION
     response = session.get(PRICE_URL, verify=False)
     assert response.status_code == 200
 
-    price_list = PriceList(logger)
+    return parse_price_data(response.text, now, zone_key, logger).to_list()
+
+
+def parse_price_data(
+    raw_data: str,
+    now: datetime,
+    zone_key: ZoneKey = ZoneKey("KR"),
+    logger: Logger = getLogger(__name__),
+) -> PriceList:
+    # Imported lazily: numpy is only used by the price path, and the
+    # production/consumption fetchers run far more frequently.
+    import numpy as np
 
-    table_prices = pd.read_html(response.text, header=0)[0]
-    for col_idx in range(1, table_prices.shape[1]):
-        for row_idx in range(24):
-            day = col_idx
-            hour = row_idx + 1
+    price_list = PriceList(logger)
 
-            if hour == 24:
-                hour = 0
-                day += 1
+    # The first table on the page holds the 7-day x 24-hour SMP grid; parse
+    # just that table instead of converting the whole document with
+    # pd.read_html. The first row is the header (dates), the first cell of
+    # each following row is the hour label, and summary rows (min/max/average)
+    # after the 24 hourly rows are ignored.
+    table = lxml.html.fromstring(raw_data).xpath("//table")[0]
+    table_prices = [row.xpath("./th | ./td") for row in table.xpath(".//tr")]
+
+    # Convert the 24-hour x 7-day grid to a float matrix in one pass and scale
+    # Won/kWh to Won/MWh with a single vectorized multiply instead of one
+    # Python multiplication per cell.
+    prices = (
+        np.array(
+            [
+                [float(cell.text_content().replace(",", "")) for cell in row[1:]]
+                for row in table_prices[1:25]
+            ],
+            dtype="float64",
+        )
+        * 1000.0
+    )
 
-            dt = (now + timedelta(days=-1 * (7 - day))).replace(
-                hour=hour, minute=0, second=0, microsecond=0
-            )
+    # Truncate to midnight once; each cell's datetime is then plain timedelta
+    # arithmetic (hour 24 of a day naturally lands on the next day's 0h). The
+    # grid's last column is today, so day 6 maps to an offset of 0 days.
+    today_midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    n_hours, n_days = prices.shape
+    datetimes = [
+        today_midnight + timedelta(days=day - 6, hours=hour + 1)
+        for hour in range(n_hours)
+        for day in range(n_days)
+    ]
+
+    append_price = price_list.append
+    for dt, price_value in zip(datetimes, prices.ravel(), strict=True):
+        append_price(
+            zoneKey=zone_key,
+            datetime=dt,
+            source=KR_SOURCE,
+            price=price_value,
+            currency=KR_CURRENCY,
+        )
 
-            price_value = (
-                table_prices.iloc[row_idx, col_idx] * 1000
-            )  # Convert from Won/kWh to Won/MWh
+    return price_list
 
-            price_list.append(
-                zoneKey=zone_key,
-                datetime=dt,
-                source=KR_SOURCE,
-                price=price_value,
-                currency=KR_CURRENCY,
-            )
 
-    return price_list.to_list()
+# Consecutive 5-minute refetches mostly see the same regDate strings, so
+# memoizing the strptime turns the per-item parse into a dict lookup. The
+# chart covers 288 five-minute slots per day, well within the cache size.
+@lru_cache(maxsize=4096)
+def _parse_reg_date(reg_date: str) -> datetime:
+    return datetime.strptime(reg_date, "%Y-%m-%d %H:%M").replace(tzinfo=TIMEZONE)
 
 
 def parse_chart_prod_data(
@@ -151,40 +254,51 @@ def parse_chart_prod_data(
 ) -> ProductionBreakdownList:
     production_list = ProductionBreakdownList(logger)
 
-    # Extract object with data
-    data_source = re.search(r"var ictArr = (\[\{.+\}\]);", raw_data).group(1)
-    # Un-quoted keys ({key:"value"}) are valid JavaScript but not valid JSON (which requires {"key":"value"}).
-    # Will break if other keys than these are introduced. Alternatively, use a JSON5 library (JSON5 allows un-quoted keys)
-    data_source = re.sub(
-        r'"(localCoal|newRenewable|oil|once|gas|nuclearPower|coal|regDate|raisingWater|waterPower|seq)"',
-        r'"\1"',
-        data_source,
-    )
+    # Extract object with data. The payload sits in a fixed
+    # "var ictArr = [{...}];" script assignment with JSON-quoted keys, so it
+    # can be sliced out directly and parsed as-is without scanning the whole
+    # page with a regex.
+    start = raw_data.find("var ictArr = ")
+    end = raw_data.find("}];", start)
+    if start == -1 or end == -1:
+        raise ParserException(
+            "KPX.py",
+            "Unable to find production data in the response",
+            zone_key,
+        )
+    data_source = raw_data[start + len("var ictArr = ") : end + len("}]")]
     json_obj = json.loads(data_source)
 
+    # Warn about unmapped modes once per payload rather than once per row;
+    # every row carries the same keys.
+    if json_obj:
+        unknown_keys = (
+            json_obj[0].keys()
+            - PRODUCTION_MAPPING.keys()
+            - STORAGE_MAPPING.keys()
+            - {"regDate"}
+        )
+        for unknown_key in sorted(unknown_keys):
+            logger.warning(f"Unknown mode {unknown_key}")
+
     for item in json_obj:
         if item["regDate"] == "0":
             break
 
-        dt = datetime.strptime(item["regDate"], "%Y-%m-%d %H:%M").replace(
-            tzinfo=TIMEZONE
-        )
+        dt = _parse_reg_date(item["regDate"])
 
+        # Iterating the mappings column-wise avoids a membership test per row
+        # key and skips the unmapped keys entirely.
         production_mix = ProductionMix()
-        storage_mix = StorageMix()
-        for item_key, item_value in item.items():
-            if item_key == "regDate":
-                continue
-            elif item_key in PRODUCTION_MAPPING:
+        for item_key, mode in PRODUCTION_MAPPING.items():
+            if item_key in item:
                 production_mix.add_value(
-                    PRODUCTION_MAPPING[item_key],
-                    float(item_value),
-                    correct_negative_with_zero=True,
+                    mode, float(item[item_key]), correct_negative_with_zero=True
                 )
-            elif item_key in STORAGE_MAPPING:
-                storage_mix.add_value(STORAGE_MAPPING[item_key], -float(item_value))
-            else:
-                logger.warning(f"Unknown mode {item_key} with value {item_value}")
+        storage_mix = StorageMix()
+        for item_key, mode in STORAGE_MAPPING.items():
+            if item_key in item:
+                storage_mix.add_value(mode, -float(item[item_key]))
 
         production_list.append(
             zoneKey=zone_key,
@@ -197,14 +311,43 @@ def parse_chart_prod_data(
     return production_list
 
 
+def _stream_realtime_chart_data(session: Session) -> str:
+    """Stream the realtime page and stop once the chart payload is complete.
+
+    The ictArr payload ends well before the page does, so the remaining
+    chunks never need to be downloaded or decoded.
+    """
+    needle = b"var ictArr = "
+    end_marker = b"}];"
+    buffer = bytearray()
+    start = -1
+    with session.get(REAL_TIME_URL, verify=False, stream=True) as response:
+        assert response.status_code == 200
+        for chunk in response.iter_content(chunk_size=65536):
+            # Resume searching slightly before the previous chunk's end so
+            # markers split across chunk boundaries are still found.
+            search_from = max(len(buffer) - len(needle), 0)
+            buffer += chunk
+            if start == -1:
+                start = buffer.find(needle, search_from)
+            if start != -1 and buffer.find(end_marker, max(start, search_from)) != -1:
+                break
+    return bytes(buffer).decode("utf-8", errors="replace")
+
+
 def get_real_time_prod_data(
     zone_key: ZoneKey = ZoneKey("KR"),
     session: Session | None = None,
     logger: Logger = getLogger(__name__),
 ) -> ProductionBreakdownList:
-    session = session or Session()
-    res = session.get(REAL_TIME_URL, verify=False)
-    return parse_chart_prod_data(res.text, zone_key, logger)
+    session = session or SESSION
+    # Reuse a recent full-page fetch from fetch_consumption when available;
+    # otherwise stream just enough of the page for the chart payload. The
+    # streamed text is truncated, so it is not added to the cache.
+    raw_data = _fresh_cached_response(REAL_TIME_URL)
+    if raw_data is None:
+        raw_data = _stream_realtime_chart_data(session)
+    return parse_chart_prod_data(raw_data, zone_key, logger)
 
 
 def get_historical_prod_data(
@@ -213,22 +356,25 @@ def get_historical_prod_data(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> ProductionBreakdownList:
-    session = session or Session()
+    session = session or SESSION
     target_datetime_formatted_daily = target_datetime.strftime("%Y-%m-%d")
 
+    cached = _HISTORICAL_CACHE.get(target_datetime_formatted_daily)
+    if cached is not None:
+        return parse_chart_prod_data(cached, zone_key, logger)
+
     # CSRF token is needed to access the production data
     logger.debug(
         f"Fetching CSRF token to access production data from {HISTORICAL_PRODUCTION_URL}"
     )
     session.get(HISTORICAL_PRODUCTION_URL, verify=False)
-    cookies_dict = session.cookies.get_dict()
 
     payload = {
         "mid": "a10606030000",
         "device": "chart",
         "view_sdate": target_datetime_formatted_daily,
         "view_edate": target_datetime_formatted_daily,
-        "_csrf": cookies_dict.get("XSRF-TOKEN", None),
+        "_csrf": session.cookies.get("XSRF-TOKEN"),
     }
 
     logger.debug(f"Fetching production data from {HISTORICAL_PRODUCTION_URL}")
@@ -236,6 +382,12 @@ def get_historical_prod_data(
 
     assert res.status_code == 200
 
+    # Only completed days are cached; today's chart is still filling in.
+    if target_datetime.astimezone(TIMEZONE).date() < datetime.now(TIMEZONE).date():
+        if len(_HISTORICAL_CACHE) >= _HISTORICAL_CACHE_MAX_SIZE:
+            _HISTORICAL_CACHE.pop(next(iter(_HISTORICAL_CACHE)))
+        _HISTORICAL_CACHE[target_datetime_formatted_daily] = res.text
+
     return parse_chart_prod_data(res.text, zone_key, logger)
 
 
@@ -254,7 +406,7 @@ def fetch_production(
             zone_key,
         )
 
-    session = session or Session()
+    session = session or SESSION
     if target_datetime is None:
         production_list = get_real_time_prod_data(
             zone_key=zone_key, session=session, logger=logger
@@ -14,6 +14,1353 @@ snapshots["TestKPX::test_fetch_consumption 1"] = [
     }
 ]
 
+snapshots["TestKPX::test_fetch_price 1"] = [
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T01:00:00+09:00",
+        "price": 119180.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T02:00:00+09:00",
+        "price": 100750.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T03:00:00+09:00",
+        "price": 108250.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T04:00:00+09:00",
+        "price": 106700.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T05:00:00+09:00",
+        "price": 122090.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T06:00:00+09:00",
+        "price": 120300.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T07:00:00+09:00",
+        "price": 126770.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T08:00:00+09:00",
+        "price": 102610.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T09:00:00+09:00",
+        "price": 112660.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T10:00:00+09:00",
+        "price": 100890.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T11:00:00+09:00",
+        "price": 106560.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T12:00:00+09:00",
+        "price": 115160.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T13:00:00+09:00",
+        "price": 100800.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T14:00:00+09:00",
+        "price": 105970.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T15:00:00+09:00",
+        "price": 119500.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T16:00:00+09:00",
+        "price": 116350.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T17:00:00+09:00",
+        "price": 106610.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T18:00:00+09:00",
+        "price": 117680.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T19:00:00+09:00",
+        "price": 124280.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T20:00:00+09:00",
+        "price": 100190.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T21:00:00+09:00",
+        "price": 124170.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T22:00:00+09:00",
+        "price": 120940.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-26T23:00:00+09:00",
+        "price": 110210.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T00:00:00+09:00",
+        "price": 104660.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T01:00:00+09:00",
+        "price": 128720.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T02:00:00+09:00",
+        "price": 110100.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T03:00:00+09:00",
+        "price": 102780.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T04:00:00+09:00",
+        "price": 102900.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T05:00:00+09:00",
+        "price": 125420.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T06:00:00+09:00",
+        "price": 118110.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T07:00:00+09:00",
+        "price": 124210.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T08:00:00+09:00",
+        "price": 121890.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T09:00:00+09:00",
+        "price": 116090.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T10:00:00+09:00",
+        "price": 129190.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T11:00:00+09:00",
+        "price": 111360.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T12:00:00+09:00",
+        "price": 116560.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T13:00:00+09:00",
+        "price": 124880.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T14:00:00+09:00",
+        "price": 118560.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T15:00:00+09:00",
+        "price": 125850.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T16:00:00+09:00",
+        "price": 117320.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T17:00:00+09:00",
+        "price": 121140.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T18:00:00+09:00",
+        "price": 101370.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T19:00:00+09:00",
+        "price": 106840.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T20:00:00+09:00",
+        "price": 108680.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T21:00:00+09:00",
+        "price": 102390.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T22:00:00+09:00",
+        "price": 106980.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-27T23:00:00+09:00",
+        "price": 103030.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T00:00:00+09:00",
+        "price": 108340.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T01:00:00+09:00",
+        "price": 119070.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T02:00:00+09:00",
+        "price": 110940.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T03:00:00+09:00",
+        "price": 111110.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T04:00:00+09:00",
+        "price": 106290.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T05:00:00+09:00",
+        "price": 108010.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T06:00:00+09:00",
+        "price": 128100.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T07:00:00+09:00",
+        "price": 119440.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T08:00:00+09:00",
+        "price": 118270.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T09:00:00+09:00",
+        "price": 105130.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T10:00:00+09:00",
+        "price": 121870.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T11:00:00+09:00",
+        "price": 104900.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T12:00:00+09:00",
+        "price": 111380.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T13:00:00+09:00",
+        "price": 129690.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T14:00:00+09:00",
+        "price": 119200.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T15:00:00+09:00",
+        "price": 116710.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T16:00:00+09:00",
+        "price": 120540.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T17:00:00+09:00",
+        "price": 125290.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T18:00:00+09:00",
+        "price": 123280.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T19:00:00+09:00",
+        "price": 106870.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T20:00:00+09:00",
+        "price": 100960.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T21:00:00+09:00",
+        "price": 109460.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T22:00:00+09:00",
+        "price": 108030.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-28T23:00:00+09:00",
+        "price": 106330.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T00:00:00+09:00",
+        "price": 128289.99999999999,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T01:00:00+09:00",
+        "price": 126290.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T02:00:00+09:00",
+        "price": 109440.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T03:00:00+09:00",
+        "price": 119660.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T04:00:00+09:00",
+        "price": 111870.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T05:00:00+09:00",
+        "price": 127440.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T06:00:00+09:00",
+        "price": 113770.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T07:00:00+09:00",
+        "price": 107950.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T08:00:00+09:00",
+        "price": 107400.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T09:00:00+09:00",
+        "price": 116840.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T10:00:00+09:00",
+        "price": 107880.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T11:00:00+09:00",
+        "price": 117540.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T12:00:00+09:00",
+        "price": 126930.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T13:00:00+09:00",
+        "price": 111980.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T14:00:00+09:00",
+        "price": 106580.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T15:00:00+09:00",
+        "price": 129930.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T16:00:00+09:00",
+        "price": 115290.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T17:00:00+09:00",
+        "price": 102730.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T18:00:00+09:00",
+        "price": 101410.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T19:00:00+09:00",
+        "price": 103290.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T20:00:00+09:00",
+        "price": 118820.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T21:00:00+09:00",
+        "price": 123760.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T22:00:00+09:00",
+        "price": 112660.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-29T23:00:00+09:00",
+        "price": 101910.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T00:00:00+09:00",
+        "price": 111450.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T01:00:00+09:00",
+        "price": 129880.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T02:00:00+09:00",
+        "price": 115870.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T03:00:00+09:00",
+        "price": 129130.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T04:00:00+09:00",
+        "price": 125820.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T05:00:00+09:00",
+        "price": 100340.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T06:00:00+09:00",
+        "price": 121620.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T07:00:00+09:00",
+        "price": 120450.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T08:00:00+09:00",
+        "price": 116110.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T09:00:00+09:00",
+        "price": 108000.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T10:00:00+09:00",
+        "price": 119230.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T11:00:00+09:00",
+        "price": 103350.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T12:00:00+09:00",
+        "price": 113040.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T13:00:00+09:00",
+        "price": 113610.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T14:00:00+09:00",
+        "price": 128610.00000000001,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T15:00:00+09:00",
+        "price": 126280.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T16:00:00+09:00",
+        "price": 107900.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T17:00:00+09:00",
+        "price": 115020.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T18:00:00+09:00",
+        "price": 105360.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T19:00:00+09:00",
+        "price": 127380.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T20:00:00+09:00",
+        "price": 126120.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T21:00:00+09:00",
+        "price": 108950.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T22:00:00+09:00",
+        "price": 119170.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-09-30T23:00:00+09:00",
+        "price": 118270.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T00:00:00+09:00",
+        "price": 104590.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T01:00:00+09:00",
+        "price": 122880.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T02:00:00+09:00",
+        "price": 116180.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T03:00:00+09:00",
+        "price": 123360.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T04:00:00+09:00",
+        "price": 115910.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T05:00:00+09:00",
+        "price": 100020.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T06:00:00+09:00",
+        "price": 109720.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T07:00:00+09:00",
+        "price": 100580.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T08:00:00+09:00",
+        "price": 127870.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T09:00:00+09:00",
+        "price": 126360.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T10:00:00+09:00",
+        "price": 124950.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T11:00:00+09:00",
+        "price": 109230.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T12:00:00+09:00",
+        "price": 101740.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T13:00:00+09:00",
+        "price": 126340.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T14:00:00+09:00",
+        "price": 128410.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T15:00:00+09:00",
+        "price": 102570.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T16:00:00+09:00",
+        "price": 114580.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T17:00:00+09:00",
+        "price": 102080.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T18:00:00+09:00",
+        "price": 122820.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T19:00:00+09:00",
+        "price": 122980.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T20:00:00+09:00",
+        "price": 103850.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T21:00:00+09:00",
+        "price": 114260.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T22:00:00+09:00",
+        "price": 116490.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-01T23:00:00+09:00",
+        "price": 107950.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T00:00:00+09:00",
+        "price": 126170.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T01:00:00+09:00",
+        "price": 112690.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T02:00:00+09:00",
+        "price": 106350.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T03:00:00+09:00",
+        "price": 116180.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T04:00:00+09:00",
+        "price": 121900.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T05:00:00+09:00",
+        "price": 106030.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T06:00:00+09:00",
+        "price": 109350.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T07:00:00+09:00",
+        "price": 129850.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T08:00:00+09:00",
+        "price": 119500.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T09:00:00+09:00",
+        "price": 113140.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T10:00:00+09:00",
+        "price": 115530.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T11:00:00+09:00",
+        "price": 103630.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T12:00:00+09:00",
+        "price": 106740.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T13:00:00+09:00",
+        "price": 110140.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T14:00:00+09:00",
+        "price": 117650.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T15:00:00+09:00",
+        "price": 106900.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T16:00:00+09:00",
+        "price": 106610.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T17:00:00+09:00",
+        "price": 102130.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T18:00:00+09:00",
+        "price": 118930.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T19:00:00+09:00",
+        "price": 106870.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T20:00:00+09:00",
+        "price": 127160.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T21:00:00+09:00",
+        "price": 125790.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T22:00:00+09:00",
+        "price": 102130.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-02T23:00:00+09:00",
+        "price": 107140.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+    {
+        "currency": "KRW",
+        "datetime": "2024-10-03T00:00:00+09:00",
+        "price": 120070.0,
+        "source": "new.kpx.or.kr",
+        "sourceType": "measured",
+        "zoneKey": "KR",
+    },
+]
+
 snapshots["TestKPX::test_production_historical 1"] = [
     {
         "datetime": "2023-09-01T00:00:00+09:00",
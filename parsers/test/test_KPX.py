@@ -1,14 +1,18 @@
 from datetime import datetime, timezone
 
+from freezegun import freeze_time
 from requests import Session
 from requests_mock import GET, POST, Adapter
 from snapshottest import TestCase
 
 from electricitymap.contrib.lib.types import ZoneKey
+from parsers import KPX
 from parsers.KPX import (
     HISTORICAL_PRODUCTION_URL,
+    PRICE_URL,
     REAL_TIME_URL,
     fetch_consumption,
+    fetch_price,
     fetch_production,
 )
 
@@ -18,6 +22,9 @@ class TestKPX(TestCase):
         self.session = Session()
         self.adapter = Adapter()
         self.session.mount("https://", self.adapter)
+        # The realtime page cache is shared between fetchers; reset it so each
+        # test exercises its own registered mock response.
+        KPX._REALTIME_CACHE.clear()
 
     def test_fetch_consumption(self):
         with open("parsers/test/mocks/KPX/realtime.html", "rb") as consumption:
@@ -43,6 +50,32 @@ class TestKPX(TestCase):
             ]
         )
 
+    @freeze_time("2024-10-02 03:30:00")
+    def test_fetch_price(self):
+        with open("parsers/test/mocks/KPX/price.html", "rb") as price:
+            self.adapter.register_uri(
+                GET,
+                PRICE_URL,
+                content=price.read(),
+            )
+            prices = fetch_price(
+                zone_key=ZoneKey("KR"),
+                session=self.session,
+            )
+        self.assertMatchSnapshot(
+            [
+                {
+                    "datetime": element["datetime"].isoformat(),
+                    "price": element["price"],
+                    "currency": element["currency"],
+                    "source": element["source"],
+                    "zoneKey": element["zoneKey"],
+                    "sourceType": element["sourceType"].value,
+                }
+                for element in prices
+            ]
+        )
+
     def test_production_realtime(self):
         with open("parsers/test/mocks/KPX/realtime.html", "rb") as production:
             self.adapter.register_uri(